@@ -1,41 +1,123 @@
-from typing import Tuple, Optional, NamedTuple, Set
+from functools import lru_cache
+from inspect import Parameter, CO_VARARGS, CO_VARKEYWORDS, signature
+from types import FunctionType, CodeType
+from typing import Tuple, Optional, NamedTuple, FrozenSet, Iterator, Any, Callable
 
-from .typing import TupleAny, DictStrAny, RestoredArgs, FieldDefinitions
+from .typing import ArgsRestorer, FieldDefinitions, ParamInfo
+
+# attributes which make `inspect.signature` differ from what function's code says
+SIGNATURE_OVERRIDES = ('__wrapped__', '__signature__')
 
 
 class ArgsSpec(NamedTuple):
     field_definitions: FieldDefinitions
     args_names: Tuple[str, ...]
+    args_names_set: FrozenSet[str]
+    positional_args_names: Tuple[str, ...]
     var_args_name: Optional[str]
     var_kwargs_name: Optional[str]
     positional_args_end: Optional[int]
+    restore_args: Optional[ArgsRestorer]  # not needed when every argument can be passed positionally
 
 
-def restore_args(
-        all_args: TupleAny,
-        all_kwargs: DictStrAny,
-        known_args_names: Set[str],
-        known_positional_args_end: Optional[int]
-) -> RestoredArgs:
+def get_params(wrapped: Callable[..., Any]) -> Iterator[ParamInfo]:
     """
-    Maps arguments to function signature
+    Yields name, annotation, default and kind of each parameter in the same order as `inspect.signature` does
 
-              known_args   additional_args   known_kwargs   additional_kwargs
-    def func( a, b,        *args,            c=1, d=2,      **kwargs): ...
+    Plain functions are read straight from the code object,
+    which is much cheaper than building `inspect.Signature` with all its parameters
     """
-    additional_args: TupleAny
-    if known_positional_args_end is None:
-        known_args = all_args
-        additional_args = ()
-    else:
-        known_args = all_args[:known_positional_args_end]
-        additional_args = all_args[known_positional_args_end:]
+    if type(wrapped) is not FunctionType or any(attr in wrapped.__dict__ for attr in SIGNATURE_OVERRIDES):
+        for param in signature(wrapped).parameters.values():
+            yield param.name, param.annotation, param.default, param.kind
+        return
+
+    empty = Parameter.empty
+    code = wrapped.__code__
+    names = code.co_varnames
+    annotations = wrapped.__annotations__
+    defaults = wrapped.__defaults__ or ()
+    kw_defaults = wrapped.__kwdefaults__ or {}
+    args_count = code.co_argcount
+    kw_only_end = args_count + code.co_kwonlyargcount
+    positional_only_count = getattr(code, 'co_posonlyargcount', 0)  # python>=3.8
+    first_default = args_count - len(defaults)
+
+    for i, name in enumerate(names[:args_count]):
+        kind = Parameter.POSITIONAL_ONLY if i < positional_only_count else Parameter.POSITIONAL_OR_KEYWORD
+        default = defaults[i - first_default] if i >= first_default else empty
+        yield name, annotations.get(name, empty), default, kind
+
+    # *args and **kwargs are stored after keyword-only args in co_varnames
+    var_name_index = kw_only_end
+    if code.co_flags & CO_VARARGS:
+        name = names[var_name_index]
+        var_name_index += 1
+        yield name, annotations.get(name, empty), empty, Parameter.VAR_POSITIONAL
+
+    for name in names[args_count:kw_only_end]:
+        yield name, annotations.get(name, empty), kw_defaults.get(name, empty), Parameter.KEYWORD_ONLY
 
+    if code.co_flags & CO_VARKEYWORDS:
+        name = names[var_name_index]
+        yield name, annotations.get(name, empty), empty, Parameter.VAR_KEYWORD
+
+
+@lru_cache(maxsize=None)
+def compile_source(source: str) -> CodeType:
+    # only a handful of distinct sources is generated for most of signatures
+    return compile(source, '<got_it>', 'exec')
+
+
+def generate_function(source: str, name: str, **namespace: Any) -> Callable[..., Any]:
+    """
+    Executes generated source with given globals and returns function defined in it
+    """
+    exec(compile_source(source), namespace)  # sources are built from templates and identifiers only
+    return namespace[name]
+
+
+RESTORE_ARGS_TEMPLATE = """
+def restore_args(all_args, all_kwargs):
+{restore_positional}
+{restore_keyword}
+    return known_args, additional_args, known_kwargs, additional_kwargs
+"""
+SPLIT_ARGS = """
+    known_args, additional_args = all_args[:{positional_args_end}], all_args[{positional_args_end}:]
+"""
+# without **kwargs unknown kwargs are validated in the root of the model anyway, so there's nothing to split
+KEEP_KWARGS = """
+    known_kwargs, additional_kwargs = dict(all_kwargs), {}
+"""
+SPLIT_KWARGS = """
     known_kwargs, additional_kwargs = {}, {}
     for name, arg in all_kwargs.items():
-        if name in known_args_names:
+        if name in known_args_names_set:
             known_kwargs[name] = arg
         else:
             additional_kwargs[name] = arg
+"""
 
-    return known_args, additional_args, known_kwargs, additional_kwargs
+
+def make_args_restorer(
+        known_args_names_set: FrozenSet[str],
+        known_positional_args_end: int,
+        has_var_kwargs: bool,
+) -> ArgsRestorer:
+    """
+    Generates function, that maps arguments to function signature
+
+              known_args   additional_args   known_kwargs   additional_kwargs
+    def func( a, b,        *args,            c=1, d=2,      **kwargs): ...
+
+    Signature is known at decoration time, so generated code contains only the steps it actually needs
+    """
+    restore_positional = SPLIT_ARGS.format(positional_args_end=known_positional_args_end)
+    restore_keyword = SPLIT_KWARGS if has_var_kwargs else KEEP_KWARGS
+
+    source = RESTORE_ARGS_TEMPLATE.format(
+        restore_positional=restore_positional.strip('\n'),
+        restore_keyword=restore_keyword.strip('\n'),
+    )
+    return generate_function(source, 'restore_args', known_args_names_set=known_args_names_set)
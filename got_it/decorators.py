@@ -1,14 +1,18 @@
 import functools
 import inspect
 import logging
-from collections import defaultdict, OrderedDict
+import sys
+import warnings
+from inspect import Parameter
 from types import FunctionType
-from typing import Any, Type, Union, Set, Dict, Optional, Tuple, no_type_check, cast
+from typing import Any, Type, Union, Set, Dict, List, Optional, Tuple, Hashable, no_type_check, cast
 
-import pydantic
+from pydantic import BaseConfig, BaseModel, Extra
+from pydantic.errors import ConfigError
+from pydantic.main import ModelMetaclass
 
-from .args import ArgsSpec
-from .parsing import parse_args, parse_result
+from .args import SIGNATURE_OVERRIDES, ArgsSpec, get_params, make_args_restorer
+from .parsing import make_args_parser, make_result_parser, make_lazy, trust_args, RETURN_KEY
 from .typing import (
     T,
     Wrapped,
@@ -18,16 +22,48 @@ from .typing import (
     STRICT_TYPES_MAPPING,
     ModelType,
     FieldDefinitions,
-    TypeAny
+    TypeAny,
+    ArgsParser,
+    ResultParser,
 )
 
 __all__ = ('all_methods', 'got_it', 'ignore_it')
 
 logger = logging.getLogger(__name__)
 
-IGNORE_IF_FIRST = ('mcs', 'cls', 'self')
+IGNORE_IF_FIRST = frozenset({'mcs', 'cls', 'self'})
+METHOD_WRAPPERS = (staticmethod, classmethod)
+# immutable types, which values can be told apart by type and repr
+CACHEABLE_DEFAULT_TYPES = frozenset({type(None), type(...), bool, int, float, complex, str, bytes})
+CONFIG_PUBLIC_ATTRS = frozenset(attr for attr in BaseConfig.__dict__ if not attr.startswith('_'))
 
-empty = object()
+# creating a model is the most expensive part of decoration, so with `cache_models=True`
+# models are shared between functions with the same name, signature, config and validators
+models_cache: Dict[Hashable, ModelType] = {}
+
+
+@functools.lru_cache(maxsize=512)
+def cached_tuple_of(annotation: Any) -> Any:
+    return Tuple[annotation, ...]
+
+
+@functools.lru_cache(maxsize=512)
+def cached_dict_str_of(annotation: Any) -> Any:
+    return Dict[str, annotation]
+
+
+def tuple_of(annotation: Any) -> Any:
+    try:
+        return cached_tuple_of(annotation)
+    except TypeError:  # annotation can't be hashed, e. g. Annotated[int, {}]
+        return Tuple[annotation, ...]
+
+
+def dict_str_of(annotation: Any) -> Any:
+    try:
+        return cached_dict_str_of(annotation)
+    except TypeError:
+        return Dict[str, annotation]
 
 
 def ignore_it(obj: T) -> T:
@@ -41,6 +77,74 @@ def ignore_it(obj: T) -> T:
     return obj
 
 
+def make_model(
+        model_name: str,
+        module: Optional[str],
+        field_definitions: FieldDefinitions,
+        config: Optional[Type[BaseConfig]],
+        validators: Dict[str, classmethod] = None
+) -> ModelType:
+    """
+    Does what `pydantic.create_model` does, but without building kwargs and merging namespaces,
+    as field definitions are always built by `got_it`
+    """
+    if module not in sys.modules:
+        # pydantic resolves annotations in the namespace of module, so it must be importable
+        module = None
+    annotations: DictStrAny = {}
+    namespace: DictStrAny = {'__annotations__': annotations, '__module__': module}
+    if validators:
+        namespace.update(validators)
+    for name, definition in field_definitions.items():
+        if name[:1] == '_':
+            warnings.warn(f'fields may not start with an underscore, ignoring "{name}"', RuntimeWarning)
+        if type(definition) is tuple:
+            try:
+                annotations[name], namespace[name] = definition
+            except ValueError as e:
+                raise ConfigError(
+                    'field definitions should either be a tuple of (<type>, <default>) or just a '
+                    'default value, unfortunately this means tuples as '
+                    'default values are not allowed'
+                ) from e
+        else:
+            namespace[name] = definition
+    if config is not None:
+        namespace['Config'] = config
+
+    return ModelMetaclass(model_name, (BaseModel,), namespace)
+
+
+def make_sync_wrapper(
+        wrapped: FunctionType,
+        parse_args: ArgsParser,
+        parse_result: Optional[ResultParser]
+) -> FunctionType:
+    def wrapper(*args, **kwargs):
+        known_args, args, known_kwargs, kwargs, = parse_args(args, kwargs)
+        result = wrapped(*known_args, *args, **known_kwargs, **kwargs)
+        if parse_result:
+            return parse_result(result)
+        return result
+
+    return cast(FunctionType, wrapper)
+
+
+def make_async_wrapper(
+        wrapped: FunctionType,
+        parse_args: ArgsParser,
+        parse_result: Optional[ResultParser]
+) -> FunctionType:
+    async def wrapper(*args, **kwargs):
+        known_args, args, known_kwargs, kwargs, = parse_args(args, kwargs)
+        result = await wrapped(*known_args, *args, **known_kwargs, **kwargs)
+        if parse_result:
+            return parse_result(result)
+        return result
+
+    return cast(FunctionType, wrapper)
+
+
 class GotItMeta(type):
     @no_type_check
     def __call__(
@@ -65,6 +169,9 @@ class GotItMeta(type):
         :param strict_types: enable strict validation for str, int, bool and float (pydantic>=1.0)
         :param ignore_untyped: threat arguments without type annotation and default like Any
         :param check_returns: tells whether to check return annotation or not
+        :param trusted: skip validation of arguments, e. g. when they're already validated by caller
+        :param cache_models: reuse models between functions with the same name, signature, config and validators
+        :param lazy: postpone inspecting signature and creating models until the first call
         :param validators: validators for pydantic.create_model
 
         :return: parametrized decorator or decorated function/class
@@ -76,8 +183,8 @@ class GotItMeta(type):
         to_wrap = maybe_obj_to_wrap
         # check, that is not a config given as positional arg, just in case.
         # we can't just check that is function cause it can be a class to decorate
-        is_config = isinstance(to_wrap, type) and issubclass(to_wrap, pydantic.BaseConfig) or any(
-            not attr.startswith('_') and attr in pydantic.BaseConfig.__dict__ for attr in to_wrap.__dict__
+        is_config = isinstance(to_wrap, type) and issubclass(to_wrap, BaseConfig) or (
+            not CONFIG_PUBLIC_ATTRS.isdisjoint(to_wrap.__dict__)
         )
         if is_config:
             # seems like config was passed as a positional arg
@@ -89,102 +196,145 @@ class GotItMeta(type):
 
 
 class got_it(metaclass=GotItMeta):
+    __slots__ = (
+        'config', 'strict_types', 'ignore_untyped', 'check_returns', 'trusted', 'cache_models', 'lazy',
+        'validators'
+    )
+
     def __init__(
             self,
             *,
-            config: Type[pydantic.BaseConfig] = None,
+            config: Type[BaseConfig] = None,
             strict_types: bool = False,
             ignore_untyped: bool = False,
             wrap_returns: bool = None,
+            trusted: bool = False,
+            cache_models: bool = False,
+            lazy: bool = False,
             **validators: classmethod
     ) -> None:
         self.config = config
         self.strict_types = strict_types
         self.ignore_untyped = ignore_untyped
         self.check_returns = wrap_returns
+        self.trusted = trusted
+        self.cache_models = cache_models
+        self.lazy = lazy
         self.validators = validators
 
     def wrap(self, wrapped: Wrapped) -> Wrapped:
         if inspect.isclass(wrapped):
             raise TypeError('wrapping class is not supported, use `all_methods(got_it)` instead')
-
-        is_method = False
         wrapped_type: TypeAny = type(wrapped)
-        if wrapped_type in (staticmethod, classmethod):
-            is_method = True
-            wrapped = wrapped.__func__  # type: ignore
-
-        wrapped = cast(FunctionType, wrapped)
-        args_spec = self.get_args_spec(wrapped)
-        args_model = self.prepare_args_model(wrapped, args_spec.field_definitions)
-        returns_model = self.prepare_returns_model(wrapped) if self.check_returns else None
-
-        if inspect.iscoroutine(wrapped):
-            async def wrapper(*args, **kwargs):
-                known_args, args, known_kwargs, kwargs, = parse_args(args_model, wrapped, args_spec, args, kwargs)
-                result = await wrapped(*known_args, *args, **known_kwargs, **kwargs)
-                if returns_model:
-                    return parse_result(returns_model, result)
-                return result
+        is_method = wrapped_type in METHOD_WRAPPERS
+        func: FunctionType = wrapped.__func__ if is_method else wrapped  # type: ignore
+
+        if self.trusted and not self.check_returns:
+            # arguments are known to be valid already, so there's nothing left to check
+            if type(func) is FunctionType:
+                func.__got_it__ = True  # type: ignore  # so `all_methods` won't validate it anyway
+            return wrapped
+
+        parse_args: ArgsParser
+        parse_result: Optional[ResultParser] = None
+        if self.trusted:
+            parse_args = trust_args
+        elif self.lazy:
+            parse_args = make_lazy(functools.partial(self.prepare_args_parser, func))
         else:
-            def wrapper(*args, **kwargs):
-                known_args, args, known_kwargs, kwargs, = parse_args(args_model, wrapped, args_spec, args, kwargs)
-                result = wrapped(*known_args, *args, **known_kwargs, **kwargs)
-                if returns_model:
-                    return parse_result(returns_model, result)
-                return result
-
-        new_obj = functools.wraps(wrapped)(wrapper)
+            parse_args = self.prepare_args_parser(func)
+        if self.check_returns:
+            if self.lazy:
+                parse_result = make_lazy(functools.partial(self.prepare_result_parser, func))
+            else:
+                parse_result = self.prepare_result_parser(func)
+
+        make_wrapper = make_async_wrapper if inspect.iscoroutinefunction(func) else make_sync_wrapper
+        wrapper = make_wrapper(func, parse_args, parse_result)
+
+        new_obj = functools.wraps(func)(wrapper)
+        # models may not be built yet (e. g. with `lazy=True`), so wrappers are marked explicitly
+        new_obj.__got_it__ = True  # type: ignore
         if is_method:
             return wrapped_type(new_obj)
         return new_obj
 
     __call__ = wrap
 
+    def prepare_args_parser(self, wrapped: FunctionType) -> ArgsParser:
+        args_spec = self.get_args_spec(wrapped)
+        return make_args_parser(self.prepare_args_model(wrapped, args_spec), wrapped, args_spec)
+
+    def prepare_result_parser(self, wrapped: FunctionType) -> ResultParser:
+        return make_result_parser(self.prepare_returns_model(wrapped))
+
     def get_args_spec(self, wrapped: FunctionType) -> ArgsSpec:
-        sign = inspect.signature(wrapped)
-        field_definitions: FieldDefinitions = OrderedDict()
+        """
+        Specs depend only on the function itself and on options used in `make_args_spec`,
+        so there's no need to inspect the same function twice (e. g. when reusing it in subclasses)
+        """
+        key = (self.strict_types, self.ignore_untyped)
+        cached_specs: Dict[Tuple[bool, bool], ArgsSpec] = {}
+        # bound methods share __dict__ with their functions, but not signatures,
+        # and signature of function with overrides may change after it's cached
+        if type(wrapped) is FunctionType and all(attr not in wrapped.__dict__ for attr in SIGNATURE_OVERRIDES):
+            # kept on function itself, so it's gone together with it
+            owner, specs = wrapped.__dict__.get('__got_it_args_specs__', (None, None))
+            if owner is wrapped:
+                cached_specs = specs
+            else:  # __dict__ could be copied from another function, e. g. by `functools.wraps`
+                wrapped.__got_it_args_specs__ = (wrapped, cached_specs)  # type: ignore
+
+        args_spec = cached_specs.get(key)
+        if args_spec is None:
+            args_spec = cached_specs[key] = self.make_args_spec(wrapped)
+        return args_spec
+
+    def make_args_spec(self, wrapped: FunctionType) -> ArgsSpec:
+        get_strict_type = None
+        if self.strict_types:
+            if STRICT_TYPES_MAPPING is NotImplemented:
+                raise RuntimeError('To use strict validators install pydantic>=1.0')
+            get_strict_type = STRICT_TYPES_MAPPING.get
+
+        field_definitions: FieldDefinitions = {}
         args_name = None
         kwargs_name = None
         positional_args_end = None
-        for i, param in enumerate(sign.parameters.values()):
-            name, annotation, default, kind, empty_ = (
-                param.name, param.annotation, param.default, param.kind, param.empty
-            )
-            if kind == param.KEYWORD_ONLY:
+        empty_ = Parameter.empty
+        for i, (name, annotation, default, kind) in enumerate(get_params(wrapped)):
+            if kind == Parameter.KEYWORD_ONLY:
                 if positional_args_end is None:
                     positional_args_end = i
-            elif kind == param.VAR_POSITIONAL:
+            elif kind == Parameter.VAR_POSITIONAL:
                 if positional_args_end is None:
                     positional_args_end = i
                 args_name = name
                 if annotation is empty_:
                     annotation = TupleAny
                 elif not getattr(annotation, '__origin__', None) is tuple:
-                    annotation = Tuple[annotation, ...]
+                    annotation = tuple_of(annotation)
                 default = ()
-            elif kind == param.VAR_KEYWORD:
+            elif kind == Parameter.VAR_KEYWORD:
                 if positional_args_end is None:
                     positional_args_end = i
                 kwargs_name = name
                 if annotation is empty_:
                     annotation = DictStrAny
                 else:
-                    annotation = Dict[str, annotation]  # type: ignore
+                    annotation = dict_str_of(annotation)
                 default = {}
 
             if annotation is empty_:
-                no_default = (default in (empty_, None))
+                no_default = default is empty_ or default is None
                 arg_ignored = i == 0 and name in IGNORE_IF_FIRST
                 if no_default and (self.ignore_untyped or arg_ignored):
                     annotation = Any
                 elif no_default:
                     raise TypeError(f"No annotation or default value specified for argument '{name}' of {wrapped}"
                                     f"use `ignore_untyped=True` to threat such params as typing.Any")
-            elif self.strict_types:
-                if STRICT_TYPES_MAPPING is NotImplemented:
-                    raise RuntimeError('To use strict validators install pydantic>=1.0')
-                strict_type = STRICT_TYPES_MAPPING.get(annotation)
+            elif get_strict_type is not None:
+                strict_type = get_strict_type(annotation)
                 if strict_type is not None:
                     annotation = strict_type
 
@@ -193,39 +343,120 @@ class got_it(metaclass=GotItMeta):
 
             field_definitions[name] = default if annotation is empty_ else (annotation, default)
 
+        args_names = tuple(field_definitions)
+        args_names_set = frozenset(field_definitions)
+        restore_args = None
+        if positional_args_end is not None:
+            restore_args = make_args_restorer(args_names_set, positional_args_end, kwargs_name is not None)
         return ArgsSpec(
             field_definitions=field_definitions,
             var_args_name=args_name,
             var_kwargs_name=kwargs_name,
-            args_names=tuple(field_definitions),
+            args_names=args_names,
+            args_names_set=args_names_set,
+            positional_args_names=args_names[:positional_args_end],
             positional_args_end=positional_args_end,
+            restore_args=restore_args,
         )
 
-    def prepare_args_model(self, wrapped: FunctionType, field_definitions: FieldDefinitions) -> ModelType:
-        args_model = pydantic.create_model(
-            model_name=getattr(wrapped, '__qualname__', 'callable') + '_args_model',
-            __config__=self.config,
-            __validators__=self.validators,
-            **field_definitions
-        )
-
-        args_model.__config__.extra = pydantic.Extra.forbid
-        logging.debug(f'Created arguments model for {wrapped} with fields: {args_model.__fields__}')
+    def prepare_args_model(self, wrapped: FunctionType, args_spec: ArgsSpec) -> ModelType:
+        field_definitions = args_spec.field_definitions
+        fields_key = get_fields_key(args_spec) if self.cache_models else None
+        args_model = self.get_model(wrapped, '_args_model', field_definitions, fields_key, self.validators)
+        args_model.__config__.extra = Extra.forbid
         wrapped.__args_model__ = args_model  # type: ignore
         return args_model
 
     def prepare_returns_model(self, wrapped: FunctionType) -> ModelType:
         return_type = wrapped.__annotations__['return']
-        returns_model = pydantic.create_model(
-            model_name=getattr(wrapped, '__qualname__', 'callable') + '_returns_model',
-            __config__=self.config,
-            returns=(return_type, ...)
-        )
-        logging.debug(f'Created returns model for {wrapped} with fields: {returns_model.__fields__}')
+        returns_model = self.get_model(wrapped, '_returns_model', {RETURN_KEY: (return_type, ...)}, (return_type,))
         wrapped.__returns_model__ = returns_model  # type: ignore
-
         return returns_model
 
+    def get_model(
+            self,
+            wrapped: FunctionType,
+            name_suffix: str,
+            field_definitions: FieldDefinitions,
+            fields_key: Optional[Hashable],
+            validators: Dict[str, classmethod] = None
+    ) -> ModelType:
+        """
+        Makes model for wrapped function, or reuses the one already made for the same definitions,
+        if `cache_models` is enabled and definitions can be compared safely (`fields_key` is not None)
+        """
+        model_name = getattr(wrapped, '__qualname__', 'callable') + name_suffix
+        module = getattr(wrapped, '__module__', None)
+        key: Optional[Hashable] = None
+        if self.cache_models and fields_key is not None:
+            validators_key = tuple(validators.items()) if validators else ()
+            key = (module, model_name, fields_key, self.config, validators_key)
+            try:
+                model = models_cache.get(key)
+            except TypeError:  # some of defaults or annotations can't be hashed
+                key = None
+            else:
+                if model is not None:
+                    return model
+
+        model = make_model(model_name, module, field_definitions, self.config, validators)
+        logger.debug('Created %s for %s with fields: %s', model_name, wrapped, model.__fields__)
+        if key is not None:
+            models_cache[key] = model
+        return model
+
+
+def get_fields_key(args_spec: ArgsSpec) -> Optional[Tuple[Tuple[Any, ...], ...]]:
+    """
+    Makes key to tell field definitions apart, or returns None if some of defaults can't be compared safely
+    """
+    fields_key: List[Tuple[Any, ...]] = []
+    for name, definition in args_spec.field_definitions.items():
+        if name == args_spec.var_args_name or name == args_spec.var_kwargs_name:
+            # defaults of *args and **kwargs are always empty
+            fields_key.append((name, definition[0]))
+            continue
+        if type(definition) is tuple and len(definition) == 2:
+            annotation, default = definition
+        else:  # malformed definitions are left for `make_model` to complain about
+            annotation, default = Parameter.empty, definition
+        if type(default) not in CACHEABLE_DEFAULT_TYPES:
+            # containers are compared by their items, so e. g. (1,) and (True,) would be considered the same
+            return None
+        # 1, 1.0 and True or 0.0 and -0.0 are equal, but shouldn't share the model
+        fields_key.append((name, annotation, type(default), repr(default)))
+    return tuple(fields_key)
+
+
+def is_wrapping_useless(wrapper: got_it, obj: Any) -> bool:
+    """
+    Tells whether function is already wrapped, or all of its arguments would be validated as `typing.Any`,
+    so there's no need to build a model for it
+    """
+    func = getattr(obj, '__func__', obj)
+    if type(func) is not FunctionType:
+        return False
+    if getattr(func, '__got_it__', False):
+        return True
+
+    # plain `got_it` class may be passed instead of instance, so its attributes are just slot descriptors
+    is_instance = isinstance(wrapper, got_it)
+    annotations = func.__annotations__
+    check_returns = is_instance and wrapper.check_returns
+    if any(name != 'return' or check_returns for name in annotations):
+        return False
+    # types of arguments are inferred from non-None defaults
+    defaults = (*(func.__defaults__ or ()), *(func.__kwdefaults__ or {}).values())
+    if any(default is not None for default in defaults):
+        return False
+    if is_instance and wrapper.ignore_untyped:
+        return True
+
+    # otherwise only the first argument is allowed to be untyped, and only if it's like self
+    code = func.__code__
+    args_count = code.co_argcount + code.co_kwonlyargcount
+    return args_count == 0 or args_count == code.co_argcount == 1 and code.co_varnames[0] in IGNORE_IF_FIRST
+
 
 def all_methods(wrapper: got_it, include_bases: bool = False, exclude: Set[str] = None, include: Set[str] = None):
     """
@@ -242,30 +473,35 @@ def all_methods(wrapper: got_it, include_bases: bool = False, exclude: Set[str]
     """
     exclude = exclude or set()
     include = include or set()
-    # we need to keep track of seen methods separately for each class,
-    # so parametrized `all_methods` could be reused as many times as needed
-    seen_methods: Dict[TypeAny, Set[str]] = defaultdict(exclude.copy)
 
     def wrap(wrapped_cls: TypeAny) -> TypeAny:
-        seen = seen_methods[wrapped_cls]
+        # seen methods are tracked separately for each wrapped class,
+        # so parametrized `all_methods` could be reused as many times as needed
+        seen: Set[str] = set()
         classes_to_wrap = wrapped_cls.__mro__ if include_bases else (wrapped_cls,)
         for cls in classes_to_wrap:  # type: ignore
             for attr, obj in cls.__dict__.items():
-                if attr in seen:
+                if attr in exclude or attr in seen:
                     continue
 
                 seen.add(attr)  # so we won't override wrapped_cls methods with bases methods
-                is_ignored = getattr(obj, '__is_ignored__', False)
-                is_sundered = attr.startswith('_')  # or dundered, whatever
-                if is_ignored or (inspect.isclass(obj) or is_sundered and attr not in include):  # type: ignore
+                # cheapest checks go first, as most of attributes are filtered out by name
+                is_sundered = attr[:1] == '_'  # or dundered, whatever
+                if is_sundered and attr not in include or isinstance(obj, type):
+                    continue
+                if getattr(obj, '__is_ignored__', False):
                     continue
 
                 obj_type = type(obj)
                 if obj_type is property:
+                    if is_wrapping_useless(wrapper, obj.fset):
+                        continue
                     new_fset = wrapper(obj.fset)
                     new_obj = obj.setter(new_fset)
                     setattr(wrapped_cls, attr, new_obj)
-                elif callable(obj) or obj_type in (classmethod, staticmethod):
+                elif callable(obj) or obj_type in METHOD_WRAPPERS:
+                    if is_wrapping_useless(wrapper, obj):
+                        continue
                     new_obj = wrapper(obj)
                     setattr(wrapped_cls, attr, new_obj)
         return wrapped_cls
@@ -1,11 +1,11 @@
 import inspect
 from functools import partial
-from typing import Type
+from typing import Any, Tuple, Set, Callable, Optional, cast
 
 import pydantic
 
-from .args import ArgsSpec, restore_args
-from .typing import Wrapped, ParsedArgs, TupleAny, DictStrAny
+from .args import ArgsSpec, generate_function
+from .typing import Wrapped, ParsedArgs, TupleAny, DictStrAny, ArgsParser, ModelType, ResultParser, Validator, ParserT
 
 # in pydantic 1.0 validate_model doesn't have attr raise_exc and always returns exception
 if 'raise_exc' in inspect.getfullargspec(pydantic.validate_model).args:
@@ -16,62 +16,143 @@ else:
 RETURN_KEY = 'returns'
 
 
-def parse_args(
-        model: Type[pydantic.BaseModel],
-        wrapped: Wrapped,
-        arg_spec: ArgsSpec,
-        all_args: TupleAny,
-        all_kwargs: DictStrAny
-) -> ParsedArgs:
+def make_validator(model: ModelType) -> Validator:
     """
-    Parses incoming arguments, maps it to args model and restores it back in right order
+    Binds model to `validate_model` once, so it's not passed around on every call
     """
-    args_names = arg_spec.args_names
-    var_kwargs_name = arg_spec.var_kwargs_name
-    var_args_name = arg_spec.var_args_name
-    positional_args_end = arg_spec.positional_args_end
-
-    known_args, additional_args, known_kwargs, additional_kwargs = restore_args(
-        all_args=all_args,
-        all_kwargs=all_kwargs,
-        known_args_names=set(args_names),
-        known_positional_args_end=positional_args_end,
-    )
+    return partial(validate_model, model)
 
-    if additional_args:
-        known_kwargs[var_args_name or 'args'] = additional_args
-    if additional_kwargs:
-        if var_kwargs_name:
-            known_kwargs[var_kwargs_name] = additional_kwargs
-        else:
-            # putting values in the root of the model to get more obvious errors
-            known_kwargs.update(additional_kwargs)
-
-    # as pydantic.BaseModel doesn't support
-    # positional arguments, we need to convert it
-    # to kwargs before validation and restore back later
-    for arg, name in zip(known_args, args_names):
-        if name in all_kwargs:  # need to manually check that, otherwise kwargs may be overwritten silently
-            f_name = getattr(wrapped, '__qualname__', wrapped)
-            raise TypeError(f"'{f_name}' got multiple values for argument '{name}'")
-        known_kwargs[name] = arg
-
-    parsed_kwargs, _fields, validation_error = validate_model(model, known_kwargs)
-    if validation_error:
-        raise validation_error
 
-    # restoring regular positional args
-    parsed_known_args = tuple([parsed_kwargs.pop(arg) for arg in args_names[:positional_args_end]])
-    # restoring *args
-    parsed_additional_args = parsed_kwargs.pop(var_args_name, ())
-    # restoring **kwargs
-    parsed_additional_kwargs = parsed_kwargs.pop(var_kwargs_name, {})
+def multiple_values_error(f_name: Any, args_names: Tuple[str, ...], duplicated_names: Set[str]) -> TypeError:
+    name = next(name for name in args_names if name in duplicated_names)
+    return TypeError(f"'{f_name}' got multiple values for argument '{name}'")
 
-    return parsed_known_args, parsed_additional_args, parsed_kwargs, parsed_additional_kwargs
 
+FIXED_ARGS_PARSER_TEMPLATE = """
+def parse_args(all_args, all_kwargs):
+    known_kwargs = dict(zip(args_names, all_args))
+    if all_kwargs:
+        # need to manually check that, otherwise kwargs may be overwritten silently
+        duplicated_names = all_kwargs.keys() & args_names[:len(all_args)]
+        if duplicated_names:
+            raise multiple_values_error(f_name, args_names, duplicated_names)
+        known_kwargs.update(all_kwargs)
 
-def parse_result(model, result):
-    result, _fields, validation_error = validate_model(model, {RETURN_KEY: result})
+    parsed_kwargs, _fields, validation_error = validate(known_kwargs)
     if validation_error:
         raise validation_error
-    return result[RETURN_KEY]
+    return ({restored_args}), (), {{}}, {{}}
+"""
+
+
+def make_fixed_args_parser(model: ModelType, wrapped: Wrapped, args_names: Tuple[str, ...]) -> ArgsParser:
+    """
+    Generates parser for function without *args, **kwargs and keyword-only args
+
+    Every argument of such function can be passed positionally,
+    so parsed values are unrolled straight into positional args
+    """
+    source = FIXED_ARGS_PARSER_TEMPLATE.format(
+        restored_args=''.join(f'parsed_kwargs[{name!r}], ' for name in args_names)
+    )
+    return generate_function(
+        source,
+        'parse_args',
+        args_names=args_names,
+        f_name=getattr(wrapped, '__qualname__', wrapped),
+        validate=make_validator(model),
+        multiple_values_error=multiple_values_error,
+    )
+
+
+def make_args_parser(model: ModelType, wrapped: Wrapped, args_spec: ArgsSpec) -> ArgsParser:
+    """
+    Makes function, that parses incoming arguments, maps it to args model and restores it back in right order
+
+    Everything derived from signature is prepared here once, so it's not looked up on every call
+    """
+    if args_spec.restore_args is None:  # there's no *args, **kwargs or keyword-only args
+        return make_fixed_args_parser(model, wrapped, args_spec.args_names)
+
+    restore_args = args_spec.restore_args
+    args_names = args_spec.args_names
+    var_args_name = args_spec.var_args_name
+    var_kwargs_name = args_spec.var_kwargs_name
+    positional_args_end = args_spec.positional_args_end
+    positional_args_names = args_spec.positional_args_names
+    f_name = getattr(wrapped, '__qualname__', wrapped)
+    validate = make_validator(model)
+
+    def parse_args(all_args: TupleAny, all_kwargs: DictStrAny) -> ParsedArgs:
+        if all_kwargs:
+            known_args, additional_args, known_kwargs, additional_kwargs = restore_args(all_args, all_kwargs)
+            # need to manually check that, otherwise kwargs may be overwritten silently
+            duplicated_names = all_kwargs.keys() & args_names[:len(known_args)]
+            if duplicated_names:
+                raise multiple_values_error(f_name, args_names, duplicated_names)
+            # without **kwargs unknown kwargs are left in the root of the model by `restore_args`
+            # to get more obvious errors
+            if additional_kwargs:
+                known_kwargs[var_kwargs_name] = additional_kwargs  # type: ignore
+        else:
+            # there's nothing to split or check when everything is passed positionally
+            known_args = all_args[:positional_args_end]
+            additional_args = all_args[positional_args_end:]
+            known_kwargs = {}
+
+        if additional_args:
+            known_kwargs[var_args_name or 'args'] = additional_args
+
+        # as pydantic.BaseModel doesn't support
+        # positional arguments, we need to convert it
+        # to kwargs before validation and restore back later
+        known_kwargs.update(zip(args_names, known_args))
+
+        parsed_kwargs, _fields, validation_error = validate(known_kwargs)
+        if validation_error:
+            raise validation_error
+
+        # restoring regular positional args
+        parsed_known_args = tuple([parsed_kwargs.pop(arg) for arg in positional_args_names])
+        # restoring *args
+        parsed_additional_args = parsed_kwargs.pop(var_args_name, ())
+        # restoring **kwargs
+        parsed_additional_kwargs = parsed_kwargs.pop(var_kwargs_name, {})
+
+        return parsed_known_args, parsed_additional_args, parsed_kwargs, parsed_additional_kwargs
+
+    return parse_args
+
+
+def trust_args(all_args: TupleAny, all_kwargs: DictStrAny) -> ParsedArgs:
+    """
+    Passes arguments as is, leaving it to the wrapped function to complain about the wrong ones
+    """
+    return all_args, (), all_kwargs, {}
+
+
+def make_lazy(make_parser: Callable[[], ParserT]) -> ParserT:
+    """
+    Postpones making parser until it's needed for the first time
+    """
+    parser: Optional[ParserT] = None
+
+    def lazy_parser(*args: Any) -> Any:
+        nonlocal parser
+        if parser is None:
+            parser = make_parser()
+        return parser(*args)
+
+    return cast(ParserT, lazy_parser)
+
+
+def make_result_parser(model: ModelType) -> ResultParser:
+    validate = make_validator(model)
+
+    def parse_result(result: Any) -> Any:
+        parsed, _fields, validation_error = validate({RETURN_KEY: result})
+        if validation_error:
+            raise validation_error
+        return parsed[RETURN_KEY]
+
+    return parse_result
@@ -1,5 +1,5 @@
 import warnings
-from typing import Tuple, Any, Iterable, Dict, Union, Callable, Type, OrderedDict, TypeVar
+from typing import Tuple, Any, Iterable, Dict, Union, Callable, Type, TypeVar, Set, Optional
 
 import pydantic
 
@@ -12,15 +12,21 @@ else:
     STRICT_TYPES_MAPPING = {int: StrictInt, float: StrictFloat, bool: StrictBool, str: StrictStr}
 
 T = TypeVar('T')
+ParserT = TypeVar('ParserT', bound=Callable[..., Any])
 
 TypeAny = Type[Any]
 TupleAny = Tuple[Any, ...]
 IterableAny = Iterable[Any]
 DictStrAny = Dict[str, Any]
 RestoredArgs = Tuple[TupleAny, TupleAny, DictStrAny, DictStrAny]
+ArgsRestorer = Callable[[TupleAny, DictStrAny], RestoredArgs]
 ParsedArgs = Tuple[Iterable[Any], TupleAny, DictStrAny, DictStrAny]
+ArgsParser = Callable[[TupleAny, DictStrAny], ParsedArgs]
+ResultParser = Callable[[Any], Any]
+Validator = Callable[[DictStrAny], Tuple[DictStrAny, Set[str], Optional[pydantic.ValidationError]]]
 ModelType = Type[pydantic.BaseModel]
-FieldDefinitions = OrderedDict[str, Union[Any, Tuple[Any, Any]]]
+FieldDefinitions = Dict[str, Union[Any, Tuple[Any, Any]]]
+ParamInfo = Tuple[str, Any, Any, Any]
 Wrapped = Union[Callable[..., Any], staticmethod, classmethod]
 Decorator = Callable[[Wrapped], Wrapped]
 
@@ -1,4 +1,8 @@
+import asyncio
+import functools
+import inspect
 import re
+import typing
 from typing import List, Any, Dict, Tuple
 
 import pydantic
@@ -6,7 +10,8 @@ import pytest
 from pydantic import ValidationError, BaseConfig, BaseModel
 
 from got_it import got_it, ignore_it
-from got_it.decorators import all_methods
+from got_it.args import get_params
+from got_it.decorators import all_methods, tuple_of, dict_str_of
 
 
 def test_basic():
@@ -143,6 +148,16 @@ def test_model_fields_equality():
     assert get_fields_params(Model.__fields__) == get_fields_params(f.__args_model__.__fields__)
 
 
+def test_model_module():
+    namespace = {}
+    exec('def f(a: int):\n    return a', {'__name__': 'not_imported_module'}, namespace)
+    assert got_it(namespace['f'])('1') == 1
+
+    with pytest.warns(RuntimeWarning, match='fields may not start with an underscore'):
+        @got_it
+        def f(_a: int): ...
+
+
 def test_errors():
     with pytest.raises(TypeError, match=re.escape('__init__() takes 1 positional argument but 2 were given')):
         @got_it(BaseConfig)
@@ -161,3 +176,273 @@ def test_errors():
     with pytest.raises(TypeError, match=r'wrapping class is not supported, use `all_methods\(got_it\)` instead'):
         @got_it(exclude=set(), include_bases=True)
         class A: ...
+
+
+def test_args_spec_cache():
+    def f(a: int, b=2): ...
+
+    assert got_it().get_args_spec(f) is got_it(config=BaseConfig).get_args_spec(f)
+    assert got_it().get_args_spec(f) is not got_it(strict_types=True).get_args_spec(f)
+    # every argument of `f` can be passed positionally, so there's nothing to restore
+    assert got_it().get_args_spec(f).restore_args is None
+
+    def g(a: int):
+        return a
+
+    got_it(g)
+
+    @functools.wraps(g)
+    def h(a, b=0):
+        return g(a) + b
+
+    def signature_of_h(a: int, b: int): ...
+
+    h.__signature__ = inspect.signature(signature_of_h)
+    assert set(got_it(h).__args_model__.__fields__) == {'a', 'b'}
+    assert got_it(h)('1', '2') == 3
+
+
+def test_get_params():
+    def f(a, b: int, c: float = 1., *args: int, d, e: str = '', **kwargs: bool) -> None: ...
+
+    for func in (f, lambda: None, lambda *a, **kw: None, functools.wraps(f)(lambda: None)):
+        assert list(get_params(func)) == [
+            (param.name, param.annotation, param.default, param.kind)
+            for param in inspect.signature(func).parameters.values()
+        ]
+
+
+def test_keyword_only():
+    @got_it
+    def f(a: int, *, b: int = 2):
+        return a, b
+
+    assert f('1') == (1, 2)
+    assert f(a='1', b='3') == (1, 3)
+
+    with pytest.raises(ValidationError) as e:
+        f(1, c=2)
+    assert e.value.errors() == [{'loc': ('c',), 'msg': 'extra fields not permitted', 'type': 'value_error.extra'}]
+
+
+def test_models_cache():
+    def make_f(cache_models=True):
+        @got_it(cache_models=cache_models, wrap_returns=True)
+        def f(a: int, *args: int, b: List[int] = None, **kwargs: int) -> int: ...
+
+        return f
+
+    assert make_f().__args_model__ is make_f().__args_model__
+    assert make_f().__returns_model__ is make_f().__returns_model__
+    assert make_f(cache_models=False).__args_model__ is not make_f(cache_models=False).__args_model__
+
+    def make_f():
+        @got_it(cache_models=True)
+        def f(a: List[int] = []): ...
+
+        return f
+
+    assert make_f().__args_model__ is not make_f().__args_model__
+
+    def make_f(default):
+        @got_it(cache_models=True)
+        def f(a: Any = default):
+            return a
+
+        return f
+
+    defaults = (1, True, 1.0, 0.0, -0.0, (1,), (True,))
+    functions = [make_f(default) for default in defaults]
+    assert [repr(f()) for f in functions] == [repr(default) for default in defaults]
+    assert len({f.__args_model__ for f in functions}) == len(defaults)
+
+    def make_f(module):
+        namespace = {}
+        exec('def f(a: int): ...', {'__name__': module}, namespace)
+        return got_it(cache_models=True)(namespace['f'])
+
+    assert make_f('first_module').__args_model__ is not make_f('second_module').__args_model__
+
+
+def run_until_complete(coroutine):
+    # `asyncio.run` is not available in python 3.6
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.mark.skipif(not hasattr(typing, 'Annotated'), reason='typing.Annotated requires python>=3.9')
+def test_unhashable_var_args_annotation():
+    annotation = typing.Annotated[int, {}]
+
+    assert tuple_of(annotation) == Tuple[annotation, ...]
+    assert dict_str_of(annotation) == Dict[str, annotation]
+    assert tuple_of(int) is tuple_of(int)
+
+
+def test_async():
+    @got_it
+    async def f(a: int, *args: int):
+        return a, args
+
+    assert inspect.iscoroutinefunction(f)
+    assert run_until_complete(f('1', '2')) == (1, (2,))
+
+    with pytest.raises(ValidationError):
+        run_until_complete(f('a'))
+
+
+def test_async_returns():
+    @got_it(wrap_returns=True)
+    async def f(a: str) -> int:
+        return a
+
+    assert run_until_complete(f('1')) == 1
+
+    with pytest.raises(ValidationError):
+        run_until_complete(f('a'))
+
+
+def test_default_not_compared():
+    class Default:
+        def __eq__(self, other):
+            raise AssertionError('defaults should be compared by identity')
+
+    default = Default()
+
+    @got_it(config=type('Config', (BaseConfig,), {'arbitrary_types_allowed': True}))
+    def f(a=default):
+        return a
+
+    assert isinstance(f(), Default)
+
+
+def test_useless_wrapping_skipped():
+    def untyped(self): ...
+
+    @got_it
+    def typed(self, i: int): ...
+
+    @all_methods(got_it(ignore_untyped=True))
+    class A:
+        m = untyped
+        t = typed
+
+        def n(self, a, *args, b=None, **kwargs): ...
+
+        def d(self, a=1):
+            return a
+
+        @got_it
+        def w(self, a: int):
+            return a
+
+    assert A.__dict__['m'] is untyped
+    assert A.__dict__['t'] is typed
+    assert not hasattr(A.n, '__wrapped__')
+    assert A().d('2') == 2
+    assert A().w('2') == 2
+    assert not hasattr(A.__dict__['w'].__wrapped__, '__wrapped__')
+
+    @all_methods(got_it)
+    class B:
+        def m(self): ...
+
+        def n(self, *args, **kwargs): ...
+
+    assert not hasattr(B.m, '__wrapped__')
+    assert not hasattr(B.n, '__wrapped__')
+
+    with pytest.raises(TypeError, match="argument 'a'"):
+        @all_methods(got_it)
+        class C:
+            def m(self, a): ...
+
+
+def test_strict_types():
+    @got_it(strict_types=True)
+    def f(a: int, b: List[int], c=1):
+        return a, b, c
+
+    assert f(1, [2], 3) == (1, [2], 3)
+    with pytest.raises(ValidationError):
+        f('1', [2])
+
+
+def test_all_methods_reused():
+    wrap_methods = all_methods(got_it, include_bases=True)
+
+    @wrap_methods
+    class A:
+        def m(self, i: int):
+            return i
+
+    @wrap_methods
+    class B(A):
+        def n(self, i: int):
+            return i
+
+    wrap_methods(B)
+    assert A().m('1') == B().m('1') == B().n('1') == 1
+    assert not hasattr(B.n.__wrapped__, '__wrapped__')
+
+    wrap_methods = all_methods(got_it(lazy=True))
+
+    class C:
+        def m(self, i: int):
+            return i
+
+    wrap_methods(wrap_methods(C))
+    assert not hasattr(C.m.__wrapped__, '__wrapped__')
+    assert C().m('1') == 1
+
+
+def test_trusted():
+    def f(a: int, b: int = 2) -> Dict[str, int]:
+        return {a: b}
+
+    assert got_it(trusted=True)(f) is f
+    f = got_it(trusted=True, wrap_returns=True)(f)
+    assert not hasattr(f, '__args_model__')
+    assert f(1, b='2') == {'1': 2}
+
+    @all_methods(got_it)
+    class A:
+        @got_it(trusted=True)
+        def m(self, a: int):
+            return a
+
+        @staticmethod
+        @got_it(trusted=True)
+        def s(a: int):
+            return a
+
+    assert A().m('1') == A.s('1') == '1'
+
+
+def test_multiple_values():
+    @got_it
+    def f(a: int, b: int, *args: int, **kwargs: int):
+        return a, b, args, kwargs
+
+    assert f(1, b=2, c=3) == (1, 2, (), {'c': 3})
+    with pytest.raises(TypeError, match="got multiple values for argument 'b'"):
+        f(1, 2, 3, b=2)
+
+
+def test_lazy():
+    @got_it(lazy=True, wrap_returns=True)
+    def f(a: int) -> str:
+        return a
+
+    assert not hasattr(f.__wrapped__, '__args_model__')
+    assert f('1') == '1'
+    assert f.__wrapped__.__args_model__.__fields__.keys() == {'a'}
+
+    @got_it(lazy=True)
+    def f(a): ...
+
+    with pytest.raises(TypeError, match="No annotation or default value specified for argument 'a'"):
+        f(1)